@@ -23,11 +23,48 @@
 import json
 import logging
 import re
-from functools import partial
+import sys
 from pathlib import Path
+from string import Formatter
 
 from . import emojipedia, languages
 
+_EMOJI_RE = re.compile(r":(\w+):")
+_EMOJI_MAP = {k: v for k, v in vars(emojipedia).items() if not k.startswith("__")}
+_LANGUAGES = {k: v for k, v in vars(languages).items() if not k.startswith("__")}
+_CACHE_SIZE = 4096
+
+
+def _parse_single_field(phrase: str):
+    # Split a phrase with exactly one plain named field into (prefix, field, suffix). Concatenating those beats
+    # str.format, but joining segments for two or more fields doesn't, so anything else is left to str.format.
+    try:
+        parsed = list(Formatter().parse(phrase))
+    except ValueError:
+        return None
+
+    prefix, field, suffix = "", None, ""
+
+    for literal, name, spec, conversion in parsed:
+        if field is not None:
+            suffix += literal
+
+            if name is not None:
+                return None
+        else:
+            prefix += literal
+
+            if name is not None:
+                if spec or conversion or not name.isidentifier():
+                    return None
+
+                field = name
+
+    if field is None:
+        return None
+
+    return prefix, field, suffix
+
 
 class Plate:
     def __init__(self, root: str = "locales", locale: str = "en_US", fallback: str = None, separator: str = "|"):
@@ -48,18 +85,29 @@ class Plate:
 
             separator (str):
                 The string used for delimiting pluralized phrases.
+                Plural phrases are split when loaded, so this can't be changed afterwards.
         """
         self.root = root
         self.locale = locale
         self.fallback = fallback or locale
-        self.separator = separator
+        self._separator = separator
 
-        self.locales = {
-            locale: [getattr(languages, locale), None]
-            for locale in filter(lambda x: not x.startswith("__"), vars(languages))
-        }
+        self._names = _LANGUAGES
+        self._phrases = {}
+        self._flat = {}
+        self._plurals = {}
+        self._has_placeholders = {}
+        self._renderers = {}
+
+        self._cache = {}
 
         self._load()
+        self._check_valid_locale(self.locale)
+
+    @property
+    def separator(self) -> str:
+        """The string used for delimiting pluralized phrases (read-only)."""
+        return self._separator
 
     def set_locale(self, locale: str):
         """Sets a new default locale.
@@ -79,7 +127,19 @@ class Plate:
                 The locale to get the translator for.
         """
         self._check_valid_locale(locale)
-        return partial(self, locale=locale)
+
+        bound_locale = locale
+        lookup = self._lookup
+
+        # The bound locale is already validated, no need to check it again on each call.
+        # An explicit locale overrides it and goes through the usual validation.
+        def translator(key: str, *, count: int = None, locale: str = None, **kwargs) -> str:
+            if locale is not None:
+                return self(key, locale, count=count, **kwargs)
+
+            return lookup(bound_locale, key, count, kwargs)
+
+        return translator
 
     def __call__(self, key: str, locale: str = None, *, count: int = None, **kwargs) -> str:
         """Translate a phrase given a key and an optional locale.
@@ -105,104 +165,171 @@ class Plate:
         """
         if locale is None:
             locale = self.locale
-        else:
+        elif locale not in self._valid:
             self._check_valid_locale(locale)
 
-        phrase = self.locales[locale][1].get(key)
+        if kwargs:
+            return self._render(locale, self.fallback, key, count, kwargs)
+
+        return self._lookup(locale, key, count, kwargs)
+
+    def _lookup(self, locale: str, key: str, count: int, kwargs: dict) -> str:
+        fallback = self.fallback
+
+        # Interpolated calls are not memoized: building a key out of arbitrary values costs more than formatting,
+        # and values that compare equal (1, 1.0, True) or change over time don't render the same.
+        if kwargs or (count is not None and type(count) is not int):
+            return self._render(locale, fallback, key, count, kwargs)
+
+        cache_key = (locale, fallback, key, count)
+        phrase = self._cache.get(cache_key)
+
+        if phrase is None:
+            phrase = self._render(locale, fallback, key, count, kwargs)
+
+            if len(self._cache) >= _CACHE_SIZE:
+                self._cache.clear()
+
+            self._cache[cache_key] = phrase
+
+        return phrase
+
+    def _render(self, locale: str, fallback: str, key: str, count: int, kwargs: dict) -> str:
+        flat = self._flat
+        phrase = flat.get((locale, key))
 
         if not phrase:
-            phrase = self.locales[self.fallback][1][key]
+            # The locale attribute can be reassigned without validation, don't let a miss hide an unloaded locale
+            if locale not in self._valid:
+                self._check_valid_locale(locale)
+
+            locale = fallback
+
+            try:
+                phrase = flat[(locale, key)]
+            except KeyError:
+                raise KeyError(key) from None
 
         try:
             if count is not None:
-                phrase = self._format_plurals(phrase, locale, count, **kwargs)
+                options = self._plurals[locale].get(key) or (phrase.strip(),)
+                phrase = self._format_plurals(options, count, **kwargs)
+            elif not kwargs:
+                if key not in self._has_placeholders[locale]:
+                    return phrase
+            else:
+                renderer = self._renderers[locale].get(key)
+
+                if renderer is not None:
+                    prefix, field, suffix = renderer
+                    return prefix + format(kwargs[field]) + suffix
 
             return phrase.format(**kwargs)
         except KeyError as e:
             raise KeyError('Missing interpolation value for key "{}"'.format(e.args[0])) from None
 
-    def _check_valid_locale(self, locale: str):
-        if locale not in self.locales:
+    def _check_valid_locale(self, locale: str, locales: dict = None):
+        if locales is None:
+            locales = self._phrases
+
+        if locale not in locales:
             raise ValueError(
                 'Invalid locale code "{}". Possible values are: {}'.format(
-                    locale, ", ".join('"{}" ({})'.format(k, v[0]) for k, v in self.locales.items())
+                    locale, ", ".join('"{}" ({})'.format(k, v) for k, v in self._names.items() if k in locales)
                 )
             )
 
     def _load(self):
-        for path in Path(self.root).iterdir():
-            name = path.name
+        self._cache.clear()
+        separator = self._separator
 
-            if not name.endswith(".json"):
-                logging.warning('Skipping unknown file "{}"'.format(name))
-                continue
+        for path in Path(self.root).glob("*.json"):
+            locale = sys.intern(path.stem)
 
-            locale = name.split(".")[0]
+            self._check_valid_locale(locale, self._names)
 
-            self._check_valid_locale(locale)
+            try:
+                locale_data = json.loads(path.read_bytes())
+            except json.JSONDecodeError as e:
+                raise ValueError('Error in file "{}": {}'.format(path.name, e)) from None
 
-            with open(str(path), encoding="utf-8") as f:
-                try:
-                    locale_data = json.load(f)
-                except json.JSONDecodeError as e:
-                    raise ValueError('Error in file "{}": {}'.format(name, e)) from None
+            locale_data = {sys.intern(k): "".join(v) if isinstance(v, list) else v for k, v in locale_data.items()}
 
-            for k, v in locale_data.items():
-                if isinstance(v, list):
-                    locale_data[k] = "".join(v)
+            plurals = {}
+            has_placeholders = set()
+            renderers = {}
 
             for k, v in locale_data.items():
+                if v is None:
+                    continue
+
                 with_emoji = v
 
-                if with_emoji is None:
-                    continue
+                # Emoji tokens need a colon, so most phrases can skip the regex entirely
+                if ":" in with_emoji:
+                    def _repl(match, k=k, locale=locale):
+                        text = match.group(1)
 
-                for text in re.findall(r":(\w+):", with_emoji):
-                    if text.islower():
-                        logging.warning(
-                            'Emoji "{}" from "{}" in "{}" should be in upper case: "{}"'.format(
-                                text, k, locale, text.upper()
+                        if text.islower():
+                            logging.warning(
+                                'Emoji "{}" from "{}" in "{}" should be in upper case: "{}"'.format(
+                                    text, k, locale, text.upper()
+                                )
                             )
-                        )
 
-                    emoji = getattr(emojipedia, text.upper(), None)
+                        emoji = _EMOJI_MAP.get(text.upper())
+
+                        if emoji is None:
+                            raise ValueError('"{}" in "{}" contains unknown emoji "{}"'.format(k, locale, text))
 
-                    if emoji is None:
-                        raise ValueError('"{}" in "{}" contains unknown emoji "{}"'.format(k, locale, text))
+                        return emoji
 
-                    with_emoji = re.sub(":{}:".format(text), emoji, with_emoji)
+                    with_emoji = _EMOJI_RE.sub(_repl, with_emoji)
 
                 locale_data[k] = with_emoji
 
-            self.locales[locale][1] = locale_data
+                if separator in with_emoji:
+                    plurals[k] = tuple(option.strip() for option in with_emoji.split(separator))
 
-        for locale in self.locales.copy():
-            if self.locales[locale][1] is None:
-                self.locales.pop(locale)
+                if "{" in with_emoji or "}" in with_emoji:
+                    has_placeholders.add(k)
 
-        fallback_keys = self.locales[self.fallback][1].keys()
+                    if k not in plurals:
+                        renderer = _parse_single_field(with_emoji)
 
-        for locale, locale_data in self.locales.items():
-            locale_data = locale_data[1]
+                        if renderer is not None:
+                            renderers[k] = renderer
 
-            for key in fallback_keys:
-                if key not in locale_data:
-                    raise ValueError('Missing translation key "{}" from "{}"'.format(key, locale))
+            self._phrases[locale] = locale_data
+            self._flat.update(((locale, k), v) for k, v in locale_data.items())
+            self._plurals[locale] = plurals
+            self._has_placeholders[locale] = has_placeholders
+            self._renderers[locale] = renderers
 
-                if not locale_data[key]:
-                    logging.warning('Empty translation phrase for key "{}" in "{}"'.format(key, locale))
+        self._valid = frozenset(self._phrases)
+
+        fallback_keys = self._phrases[self.fallback].keys()
 
-            for key in locale_data:
-                if key not in fallback_keys:
-                    raise ValueError(
-                        'The key "{}" from "{}" does not exist in fallback locale "{}"'.format(
-                            key, locale, self.fallback
-                        )
-                    )
+        for locale, locale_data in self._phrases.items():
+            missing = fallback_keys - locale_data.keys()
 
-    def _format_plurals(self, phrase: str, locale: str, count: int, **kwargs) -> str:
-        options = [option.strip() for option in phrase.split(self.separator)]
+            if missing:
+                key = next(key for key in fallback_keys if key in missing)
+                raise ValueError('Missing translation key "{}" from "{}"'.format(key, locale))
+
+            extra = locale_data.keys() - fallback_keys
+
+            if extra:
+                key = next(key for key in locale_data if key in extra)
+                raise ValueError(
+                    'The key "{}" from "{}" does not exist in fallback locale "{}"'.format(key, locale, self.fallback)
+                )
+
+            for key, phrase in locale_data.items():
+                if not phrase:
+                    logging.warning('Empty translation phrase for key "{}" in "{}"'.format(key, locale))
 
+    def _format_plurals(self, options: tuple, count: int, **kwargs) -> str:
         # TODO: Add locales plural rules
 
         index = count if count < 3 else 2
@@ -0,0 +1,129 @@
+#  MIT License
+#
+#  Copyright (c) 2020 Dan <https://github.com/delivrance>
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+
+import json
+import tempfile
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+from plate import Plate
+
+EN_US = {
+    "hello": "Hello",
+    "num": "{n}",
+    "attr": "{u.name}",
+    "apples": "No apples | One apple | {count} apples | Many apples",
+    "esc": "{{literal}} {x}",
+    "plain": "Plain",
+}
+
+IT_IT = {
+    "hello": "Ciao",
+    "num": "{n}!",
+    "attr": "{u.name}",
+    "apples": "Nessuna mela | Una mela | {count} mele | Molte mele",
+    "esc": "",
+    "plain": "",
+}
+
+
+class User:
+    def __init__(self, name):
+        self.name = name
+
+
+class PlateTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+
+        for locale, data in (("en_US", EN_US), ("it_IT", IT_IT)):
+            Path(self.root, locale + ".json").write_text(json.dumps(data), encoding="utf-8")
+
+        self.plate = Plate(self.root)
+
+    def test_type_distinct_values(self):
+        self.assertEqual(self.plate("num", n=1), "1")
+        self.assertEqual(self.plate("num", n=True), "True")
+        self.assertEqual(self.plate("num", n=1.0), "1.0")
+        self.assertEqual(self.plate("num", n=Decimal("1.50")), "1.50")
+        self.assertEqual(self.plate("num", n=Decimal("1.5")), "1.5")
+
+    def test_type_distinct_count(self):
+        self.assertEqual(self.plate("apples", count=2), "2 apples")
+        self.assertEqual(self.plate("apples", count=True), "One apple")
+        self.assertEqual(self.plate("apples", count=1), "One apple")
+
+    def test_mutated_object(self):
+        user = User("a")
+        self.assertEqual(self.plate("attr", u=user), "a")
+
+        user.name = "b"
+        self.assertEqual(self.plate("attr", u=user), "b")
+
+    def test_negative_count(self):
+        self.assertEqual(self.plate("apples", count=-1), "Many apples")
+        self.assertEqual(self.plate("apples", count=-2), "-2 apples")
+
+    def test_translator_locale_override(self):
+        italian = self.plate.get_translator("it_IT")
+
+        self.assertEqual(italian("num", n=3), "3!")
+        self.assertEqual(italian("num", n=3, locale="en_US"), "3")
+
+        with self.assertRaises(ValueError):
+            italian("hello", locale="de_DE")
+
+    def test_invalid_explicit_locale(self):
+        with self.assertRaises(ValueError):
+            self.plate("hello", "de_DE")
+
+        with self.assertRaises(ValueError):
+            self.plate("hello", "xx_XX")
+
+    def test_unloaded_default_locale(self):
+        with self.assertRaises(ValueError):
+            Plate(self.root, locale="de_DE", fallback="en_US")
+
+        self.plate.locale = "de_DE"
+
+        with self.assertRaises(ValueError):
+            self.plate("hello")
+
+    def test_fallback_reassigned(self):
+        plate = Plate(self.root, locale="it_IT", fallback="en_US")
+        self.assertEqual(plate("esc", x=1), "{literal} 1")
+        self.assertEqual(plate("plain"), "Plain")
+
+        plate.fallback = "it_IT"
+        self.assertEqual(plate("esc", x=1), "")
+        self.assertEqual(plate("plain"), "")
+
+    def test_separator_is_read_only(self):
+        with self.assertRaises(AttributeError):
+            self.plate.separator = ";"
+
+
+if __name__ == "__main__":
+    unittest.main()